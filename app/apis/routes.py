@@ -1,12 +1,19 @@
-from flask import Blueprint, request, jsonify, render_template
+from flask import Blueprint, Response, request, jsonify, render_template
 import yaml
 import json
+import os
+import hmac
 from app.utils.storage import (
+    BATCH_SIZE,
     get_networks,
     get_network,
     add_network,
     update_heartbeat,
-    remove_network
+    remove_network,
+    iter_networks,
+    validate_imported_network,
+    import_networks,
+    save_networks
 )
 import time
 from datetime import datetime
@@ -399,4 +406,132 @@ def list_networks():
         return jsonify({
             'success': False,
             'error': f'Failed to list networks: {str(e)}'
-        }), 500 
\ No newline at end of file
+        }), 500 
+
+def _check_admin_token():
+    """
+    Check the admin token for registry export/import.
+    
+    Returns an error response, or None if the request is authorized.
+    """
+    admin_token = os.getenv('ADMIN_TOKEN')
+    if not admin_token:
+        return jsonify({
+            'success': False,
+            'error': 'Registry export/import is disabled. Set ADMIN_TOKEN to enable it.'
+        }), 403
+    
+    authorization = request.headers.get('Authorization', '')
+    if not authorization.startswith('Bearer '):
+        return jsonify({
+            'success': False,
+            'error': 'An Authorization: Bearer <ADMIN_TOKEN> header is required.'
+        }), 403
+    provided_token = authorization[len('Bearer '):]
+    
+    if not hmac.compare_digest(provided_token.encode(), admin_token.encode()):
+        return jsonify({
+            'success': False,
+            'error': 'Invalid admin token.'
+        }), 403
+    
+    return None
+
+@api_bp.route('/export', methods=['GET'])
+def export_networks():
+    """
+    Export the whole registry as NDJSON, one network per line.
+    
+    Requires an `Authorization: Bearer <ADMIN_TOKEN>` header, since the
+    export includes management tokens.
+    """
+    error = _check_admin_token()
+    if error:
+        return error
+    
+    def generate():
+        for network_data in iter_networks():
+            yield json.dumps(network_data, allow_nan=False) + '\n'
+    
+    return Response(generate(), mimetype='application/x-ndjson')
+
+@api_bp.route('/import', methods=['POST'])
+def import_registry():
+    """
+    Import networks from an NDJSON body, one network per line.
+    
+    Lines are read from the request stream and added to the registry in
+    batches of BATCH_SIZE networks, then the data file is saved once.
+    Existing networks with the same ID are replaced, so a failed import
+    can be resumed by sending the same lines again.
+    
+    If a line is invalid, the lines before it are still imported and the
+    import stops there.
+    
+    Requires an `Authorization: Bearer <ADMIN_TOKEN>` header.
+    
+    Returns:
+    - success: Boolean indicating success
+    - imported: Number of networks imported
+    - line: On invalid input, the line number (from 1) that was rejected
+    - reason: On invalid input, why the line was rejected
+    - error: On failure, the reason
+    """
+    error = _check_admin_token()
+    if error:
+        return error
+    
+    imported = 0
+    line_number = 0
+    batch = []
+    invalid_error = None
+    try:
+        for line in request.stream:
+            line_number += 1
+            line = line.strip()
+            if not line:
+                continue
+            
+            try:
+                network_data = json.loads(line)
+                validate_imported_network(network_data)
+            except ValueError as e:
+                invalid_error = str(e)
+                break
+            except RecursionError:
+                invalid_error = 'JSON is nested too deeply'
+                break
+            batch.append(network_data)
+            
+            if len(batch) >= BATCH_SIZE:
+                imported += import_networks(batch)
+                batch = []
+        
+        imported += import_networks(batch)
+        
+        if invalid_error:
+            return jsonify({
+                'success': False,
+                'imported': imported,
+                'line': line_number,
+                'reason': invalid_error,
+                'error': f'Invalid network on line {line_number}: {invalid_error}'
+            }), 400
+        
+        return jsonify({
+            'success': True,
+            'imported': imported,
+            'message': f'Imported {imported} networks.'
+        })
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'imported': imported,
+            'error': f'Failed to import networks: {str(e)}'
+        }), 500
+    
+    finally:
+        # Keep networks.json in step with whatever was merged into memory
+        if imported:
+            save_networks()
@@ -1,5 +1,6 @@
 import os
 import json
+import math
 import time
 from datetime import datetime, timedelta
 import threading
@@ -11,6 +12,12 @@ file_lock = threading.Lock()
 DATA_FILE = os.getenv('DATA_FILE', 'networks.json')
 DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), DATA_FILE)
 
+# Number of networks handled per lock acquisition during export/import
+BATCH_SIZE = 500
+
+# How far in the future an imported last_heartbeat may be, to allow for clock skew
+MAX_HEARTBEAT_SKEW_SECONDS = 300
+
 # In-memory cache of networks
 _networks = {}
 
@@ -30,8 +37,11 @@ def _load_networks():
 def _save_networks():
     """Save networks to the data file."""
     try:
-        with open(DATA_PATH, 'w') as f:
+        # Write to a temporary file first so readers never see a partial file
+        tmp_path = f"{DATA_PATH}.tmp"
+        with open(tmp_path, 'w') as f:
             json.dump(_networks, f, indent=2)
+        os.replace(tmp_path, DATA_PATH)
     except Exception as e:
         print(f"Error saving networks: {e}")
 
@@ -48,6 +58,86 @@ def get_network(network_id):
     with file_lock:
         return _networks.get(network_id)
 
+def iter_networks(batch_size=BATCH_SIZE):
+    """
+    Yield networks one at a time for export.
+    
+    The lock is only held while copying each batch, so publishes and
+    heartbeats are not blocked for the whole export.
+    """
+    with file_lock:
+        network_ids = list(_networks.keys())
+    
+    for start in range(0, len(network_ids), batch_size):
+        with file_lock:
+            batch = [
+                dict(_networks[network_id])
+                for network_id in network_ids[start:start + batch_size]
+                if network_id in _networks
+            ]
+        for network_data in batch:
+            yield network_data
+
+def validate_imported_network(network_data):
+    """
+    Check that an exported network record can be imported.
+    
+    Returns the network ID, or raises ValueError describing the problem.
+    """
+    if not isinstance(network_data, dict):
+        raise ValueError("Network must be a JSON object")
+    
+    network_profile = network_data.get('network_profile')
+    if not isinstance(network_profile, dict):
+        raise ValueError("network_profile must be an object")
+    
+    network_id = network_profile.get('network_id')
+    if not network_id or not isinstance(network_id, str):
+        raise ValueError("Network must have a network_id in network_profile")
+    
+    for field in ('installed_protocols', 'required_adapters'):
+        if not isinstance(network_profile.get(field), list):
+            raise ValueError(f"{field} must be a list")
+    
+    last_heartbeat = network_data.get('last_heartbeat')
+    if last_heartbeat is not None:
+        if isinstance(last_heartbeat, bool) or not isinstance(last_heartbeat, (int, float)):
+            raise ValueError("last_heartbeat must be a number")
+        # Out-of-range timestamps break datetime.fromtimestamp and cleanup
+        if not math.isfinite(last_heartbeat) or not (
+            0 <= last_heartbeat <= time.time() + MAX_HEARTBEAT_SKEW_SECONDS
+        ):
+            raise ValueError("last_heartbeat must be a Unix timestamp that is not in the future")
+    
+    return network_id
+
+def import_networks(networks):
+    """
+    Add or replace a batch of validated networks in memory.
+    
+    Each network must already have passed validate_imported_network. The
+    data file is not written; call save_networks once the import is done.
+    Unlike add_network, the exported last_heartbeat is kept if present.
+    """
+    batch = {}
+    for network_data in networks:
+        network_id = network_data['network_profile']['network_id']
+        network_data.setdefault('last_heartbeat', time.time())
+        batch[network_id] = network_data
+    
+    if not batch:
+        return 0
+    
+    with file_lock:
+        _networks.update(batch)
+    
+    return len(batch)
+
+def save_networks():
+    """Write the current networks to the data file."""
+    with file_lock:
+        _save_networks()
+
 def add_network(network_data):
     """Add or update a network."""
     network_id = network_data.get('network_profile', {}).get('network_id')
@@ -0,0 +1,172 @@
+"""
+Export or import the network registry of a running OpenDiscovery server.
+
+Usage:
+    python registry.py export registry.ndjson
+    python registry.py import registry.ndjson [--resume]
+
+The registry is streamed as NDJSON (one network per line), so memory use
+does not grow with the number of networks. Imports are sent in chunks and
+the number of lines sent so far is written to a checkpoint file, so an
+interrupted import can be continued with --resume.
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+
+import requests
+from dotenv import load_dotenv
+
+# The server reads its settings from app/.env; a .env in the repo root also works
+load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app', '.env'))
+load_dotenv()
+
+DEFAULT_URL = os.getenv('OPENDISCOVERY_URL', 'http://localhost:5000')
+
+
+def _headers(admin_token):
+    return {'Authorization': f'Bearer {admin_token}'}
+
+
+def export_registry(url, admin_token, output_path):
+    """Download the registry line by line into output_path."""
+    # Write to a temporary file so an interrupted export never looks complete
+    tmp_path = f'{output_path}.tmp'
+    count = 0
+    try:
+        with requests.get(f'{url}/apis/export', headers=_headers(admin_token), stream=True) as response:
+            response.raise_for_status()
+            with open(tmp_path, 'wb') as f:
+                for line in response.iter_lines():
+                    if line:
+                        f.write(line + b'\n')
+                        count += 1
+    except requests.RequestException as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        print(f'Export failed: {e}', file=sys.stderr)
+        return 1
+
+    os.replace(tmp_path, output_path)
+    print(f'Exported {count} networks to {output_path}')
+    return 0
+
+
+def _input_signature(input_path):
+    """Size and modification time of the input file, to detect edits between runs."""
+    stat = os.stat(input_path)
+    return {'size': stat.st_size, 'mtime': stat.st_mtime}
+
+
+def _read_checkpoint(checkpoint_path, url, input_path):
+    """Return the number of lines of input_path already imported into url, or 0."""
+    if not os.path.exists(checkpoint_path):
+        return 0
+    try:
+        with open(checkpoint_path, 'r') as f:
+            checkpoint = json.load(f)
+    except (ValueError, OSError):
+        print(f'Ignoring unreadable checkpoint {checkpoint_path}')
+        return 0
+    if checkpoint.get('url') != url:
+        print(f'Ignoring checkpoint for a different server ({checkpoint.get("url")})')
+        return 0
+    if checkpoint.get('input') != _input_signature(input_path):
+        print(f'Ignoring checkpoint because {input_path} has changed since it was written')
+        return 0
+    return int(checkpoint.get('lines_done', 0))
+
+
+def _write_checkpoint(checkpoint_path, url, input_path, lines_done):
+    with open(checkpoint_path, 'w') as f:
+        json.dump({
+            'url': url,
+            'input': _input_signature(input_path),
+            'lines_done': lines_done
+        }, f)
+
+
+def _import_failed(lines_done, error):
+    print(f'Import failed after line {lines_done}: {error}', file=sys.stderr)
+    print('Rerun with --resume to continue; if you edit the file, it is imported again from the start.', file=sys.stderr)
+    return 1
+
+
+def import_registry(url, admin_token, input_path, chunk_size, resume):
+    """Upload input_path in chunks of chunk_size lines, checkpointing after each one."""
+    checkpoint_path = f'{input_path}.checkpoint'
+    lines_done = 0
+    if resume:
+        lines_done = _read_checkpoint(checkpoint_path, url, input_path)
+        if lines_done:
+            print(f'Resuming after line {lines_done}')
+
+    total_imported = 0
+    with open(input_path, 'rb') as f:
+        lines = itertools.islice(f, lines_done, None)
+        while True:
+            chunk = list(itertools.islice(lines, chunk_size))
+            if not chunk:
+                break
+
+            try:
+                response = requests.post(
+                    f'{url}/apis/import',
+                    headers={**_headers(admin_token), 'Content-Type': 'application/x-ndjson'},
+                    data=b''.join(chunk)
+                )
+                result = response.json()
+            except requests.RequestException as e:
+                return _import_failed(lines_done, f'Request failed: {e}')
+            except ValueError:
+                return _import_failed(lines_done, f'Unexpected response from server (HTTP {response.status_code})')
+
+            if not result.get('success'):
+                error = result.get('error', f'HTTP {response.status_code}')
+                if 'line' in result:
+                    # The server counts lines from the start of this chunk
+                    error = f'Invalid network on line {lines_done + result["line"]} of {input_path}: {result.get("reason")}'
+                return _import_failed(lines_done, error)
+
+            lines_done += len(chunk)
+            total_imported += result.get('imported', 0)
+            _write_checkpoint(checkpoint_path, url, input_path, lines_done)
+            print(f'Imported {total_imported} networks ({lines_done} lines)')
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    print(f'Import complete: {total_imported} networks')
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export or import the OpenDiscovery network registry.')
+    parser.add_argument('--url', default=DEFAULT_URL, help='Base URL of the OpenDiscovery server')
+    parser.add_argument('--admin-token', default=os.getenv('ADMIN_TOKEN'), help='Admin token (defaults to ADMIN_TOKEN)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = subparsers.add_parser('export', help='Export the registry to an NDJSON file')
+    export_parser.add_argument('output', help='Path of the NDJSON file to write')
+
+    import_parser = subparsers.add_parser('import', help='Import networks from an NDJSON file')
+    import_parser.add_argument('input', help='Path of the NDJSON file to read')
+    import_parser.add_argument(
+        '--chunk-size', type=int, default=10000,
+        help='Lines sent per request; each request rewrites the whole data file on the server'
+    )
+    import_parser.add_argument('--resume', action='store_true', help='Continue from the last checkpoint')
+
+    args = parser.parse_args()
+    if not args.admin_token:
+        parser.error('an admin token is required (--admin-token or ADMIN_TOKEN)')
+
+    url = args.url.rstrip('/')
+    if args.command == 'export':
+        return export_registry(url, args.admin_token, args.output)
+    return import_registry(url, args.admin_token, args.input, args.chunk_size, args.resume)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
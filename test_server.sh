@@ -3,6 +3,19 @@
 # Make the script executable
 chmod +x test_server.sh
 
+# Admin token for the registry export/import endpoints
+export ADMIN_TOKEN="test-admin-token"
+IMPORT_DATA_FILE="test_import_networks.json"
+
+# Print PASS or FAIL for an expected value
+check() {
+  if [ "$2" == "$3" ]; then
+    echo "PASS: $1"
+  else
+    echo "FAIL: $1 (expected $2, got $3)"
+  fi
+}
+
 # Start the server in the background
 echo "Starting the server..."
 python run.py &
@@ -65,19 +78,77 @@ curl -s -X POST -H "Content-Type: application/json" -d "{
 echo -e "\n5. Listing networks again..."
 curl -s http://localhost:5000/apis/list_networks | python -m json.tool
 
-# 6. Unpublish the network
-echo -e "\n6. Unpublishing the network..."
+# 6. Export and import without an admin token (should be forbidden)
+echo -e "\n6. Exporting and importing without an admin token (should fail)..."
+STATUS=$(curl -s -o /dev/null -w "%{http_code}" http://localhost:5000/apis/export)
+check "export without token" 403 $STATUS
+STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X POST --data-binary @/dev/null http://localhost:5000/apis/import)
+check "import without token" 403 $STATUS
+
+# 7. Export and import with a wrong admin token (should be forbidden)
+echo -e "\n7. Exporting and importing with a wrong admin token (should fail)..."
+STATUS=$(curl -s -o /dev/null -w "%{http_code}" -H "Authorization: Bearer wrong-token" http://localhost:5000/apis/export)
+check "export with wrong token" 403 $STATUS
+STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X POST -H "Authorization: Bearer wrong-token" --data-binary @/dev/null http://localhost:5000/apis/import)
+check "import with wrong token" 403 $STATUS
+STATUS=$(curl -s -o /dev/null -w "%{http_code}" -H "Authorization: $ADMIN_TOKEN" http://localhost:5000/apis/export)
+check "export without Bearer scheme" 403 $STATUS
+
+# 8. Export the registry, import it into a second server with a fresh data file, and compare
+echo -e "\n8. Moving the registry to a second server..."
+rm -f $IMPORT_DATA_FILE
+DATA_FILE=$IMPORT_DATA_FILE python -c "from app import create_app; create_app().run(port=5001)" &
+IMPORT_SERVER_PID=$!
+sleep 3
+
+python registry.py --url http://localhost:5000 export test_export.ndjson
+python registry.py --url http://localhost:5001 import test_export.ndjson --chunk-size 1
+python registry.py --url http://localhost:5001 export test_reimport.ndjson
+
+SAME=$(python -c "
+import json
+def load(path):
+    with open(path) as f:
+        return {n['network_profile']['network_id']: n for n in map(json.loads, f)}
+print(load('test_export.ndjson') == load('test_reimport.ndjson') and len(load('test_export.ndjson')) > 0)
+")
+check "imported registry matches export" True $SAME
+
+# 9. Import a body whose second line is invalid (should fail on line 2)
+echo -e "\n9. Importing an invalid line (should fail on line 2)..."
+IMPORT_RESPONSE=$(printf '%s\n%s\n' "$(head -n 1 test_export.ndjson)" '{"network_profile": "oops"}' | \
+  curl -s -w "\n%{http_code}" -X POST -H "Authorization: Bearer $ADMIN_TOKEN" --data-binary @- http://localhost:5001/apis/import)
+echo "$IMPORT_RESPONSE" | head -n 1 | python -m json.tool
+check "invalid import status" 400 $(echo "$IMPORT_RESPONSE" | tail -n 1)
+check "invalid import line" 2 $(echo "$IMPORT_RESPONSE" | head -n 1 | python -c "import sys, json; print(json.load(sys.stdin).get('line'))")
+
+
+# An out-of-range last_heartbeat is rejected too
+IMPORT_RESPONSE=$(head -n 1 test_export.ndjson | python -c "
+import sys, json
+network = json.loads(sys.stdin.read())
+network['last_heartbeat'] = 1e20
+print(json.dumps(network))
+" | curl -s -w "\n%{http_code}" -X POST -H "Authorization: Bearer $ADMIN_TOKEN" --data-binary @- http://localhost:5001/apis/import)
+check "future heartbeat import status" 400 $(echo "$IMPORT_RESPONSE" | tail -n 1)
+check "future heartbeat import line" 1 $(echo "$IMPORT_RESPONSE" | head -n 1 | python -c "import sys, json; print(json.load(sys.stdin).get('line'))")
+
+kill $IMPORT_SERVER_PID
+rm -f $IMPORT_DATA_FILE test_export.ndjson test_reimport.ndjson
+
+# 10. Unpublish the network
+echo -e "\n10. Unpublishing the network..."
 curl -s -X POST -H "Content-Type: application/json" -d "{
   \"network_id\": \"network-12345678\",
   \"management_token\": \"$MANAGEMENT_TOKEN\"
 }" http://localhost:5000/apis/unpublish | python -m json.tool
 
-# 7. List networks again (should be empty)
-echo -e "\n7. Listing networks (should be empty again)..."
+# 11. List networks again (should be empty)
+echo -e "\n11. Listing networks (should be empty again)..."
 curl -s http://localhost:5000/apis/list_networks | python -m json.tool
 
-# 8. Try to publish a network with the same ID (should fail)
-echo -e "\n8. Trying to publish a network with the same ID (should fail)..."
+# 12. Try to publish a network with the same ID (should fail)
+echo -e "\n12. Trying to publish a network with the same ID (should fail)..."
 curl -s -X POST -H "Content-Type: application/json" -d '{
   "network_id": "network-12345678",
   "name": "ExampleNetwork",